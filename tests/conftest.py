@@ -0,0 +1,137 @@
+"""
+Shared pytest fixtures for the Mergington High School API tests.
+
+All client construction, state snapshotting and reset logic lives here so
+test modules only need to import the symbols they assert on.
+
+The suite can run in parallel with ``pytest -n auto`` (pytest-xdist). Each
+worker is its own process with its own ``activities`` dict, snapshot and
+session-scoped client, so no mutable state is shared between workers.
+"""
+
+import pickle
+from types import MappingProxyType
+
+import httpx
+import pytest
+
+from src.app import app, activities
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# ---------------------------------------------------------------------------
+# Snapshot of the original activities dict captured once at import time.
+# This gives us a clean reference independent of any test mutations. A pickle
+# round trip is a cheaper deep copy than copy.deepcopy for plain data.
+# ---------------------------------------------------------------------------
+ORIGINAL_ACTIVITIES = pickle.loads(
+    pickle.dumps(activities, protocol=pickle.HIGHEST_PROTOCOL)
+)
+_PRISTINE_PARTICIPANTS = {
+    name: tuple(activity["participants"]) for name, activity in ORIGINAL_ACTIVITIES.items()
+}
+# Read-only view handed to tests, so they cannot corrupt the reset snapshot.
+_ORIGINAL_ACTIVITIES_VIEW = MappingProxyType({
+    name: MappingProxyType({**activity, "participants": _PRISTINE_PARTICIPANTS[name]})
+    for name, activity in ORIGINAL_ACTIVITIES.items()
+})
+
+# Set by any non-GET request that reaches the app, and by any test that takes
+# the live ``activities`` fixture; reset_activities skips the restore while it
+# is clear.
+_DIRTY = [False]
+
+
+async def _tracking_app(scope, receive, send):
+    """ASGI middleware that marks the state dirty on any mutating request."""
+    if scope["type"] == "http" and scope["method"] not in ("GET", "HEAD"):
+        _DIRTY[0] = True
+    await app(scope, receive, send)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    """Restore the shared in-memory activities dict after every test.
+
+    Only the participants lists are reset, in place, and ``activities`` is
+    never rebound, so the dicts the app holds keep their identity across
+    tests. Tests that neither sent a mutating request nor took the live
+    ``activities`` fixture leave the state untouched and skip the restore.
+    """
+    yield
+    if not _DIRTY[0]:
+        return
+    _DIRTY[0] = False
+    _restore_activities()
+
+
+def _restore_activities():
+    """Put ``activities`` back to the seed data, in place."""
+    for name in activities.keys() - ORIGINAL_ACTIVITIES.keys():
+        del activities[name]
+    if activities.keys() != ORIGINAL_ACTIVITIES.keys():
+        # An original activity was removed — rebuild in seed order, reusing
+        # the surviving activity dicts so their identity stays stable.
+        survivors = dict(activities)
+        activities.clear()
+        for name, original in ORIGINAL_ACTIVITIES.items():
+            if name not in survivors:
+                survivors[name] = {**original, "participants": []}
+            activities[name] = survivors[name]
+    # Participants is the only field the endpoints mutate.
+    for name, pristine in _PRISTINE_PARTICIPANTS.items():
+        activities[name]["participants"][:] = pristine
+
+
+@pytest.fixture
+def restore_activities():
+    """The restore routine used by ``reset_activities``, for testing it directly."""
+    return _restore_activities
+
+
+@pytest.fixture(name="activities")
+def activities_fixture():
+    """The app's live in-memory activities dict, for tests that inspect state.
+
+    Any test holding the live dict may change it, so it is always restored.
+    """
+    _DIRTY[0] = True
+    return activities
+
+
+@pytest.fixture(scope="session")
+def original_activities():
+    """A read-only view of the seed activities as captured at import time."""
+    return _ORIGINAL_ACTIVITIES_VIEW
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """A single in-process AsyncClient shared by the whole session.
+
+    Requests go straight to the ASGI app through ``httpx.ASGITransport``,
+    without TestClient's sync-to-async portal. State isolation is handled by
+    the autouse ``reset_activities`` fixture.
+    """
+    transport = httpx.ASGITransport(app=_tracking_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
@@ -1,43 +1,25 @@
 """
 Tests for the Mergington High School API (src/app.py).
 
-Uses FastAPI's synchronous TestClient (backed by httpx).
+Uses an in-process httpx.AsyncClient driven by the anyio pytest plugin.
 Every test follows the Arrange-Act-Assert (AAA) pattern:
   - Arrange: prepare inputs and preconditions
   - Act:     call the endpoint under test
   - Assert:  verify the response and side-effects
 
-An autouse fixture deep-copies the initial activities state before each test
-and restores it afterwards, so signup/unregister mutations don't bleed across tests.
+Fixtures live in tests/conftest.py: a session-wide `client`, the live
+`activities` dict and its `original_activities` seed snapshot, and an autouse
+`reset_activities` that restores the in-memory state after every test, so
+signup/unregister mutations don't bleed across tests.
 """
 
-import copy
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
-from src.app import app, activities
+pytestmark = pytest.mark.anyio
 
-# ---------------------------------------------------------------------------
-# Snapshot of the original activities dict captured at import time.
-# This gives us a clean reference independent of any test mutations.
-# ---------------------------------------------------------------------------
-_ORIGINAL_ACTIVITIES = copy.deepcopy(activities)
-
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Restore the shared in-memory activities dict after every test."""
-    yield
-    activities.clear()
-    activities.update(copy.deepcopy(_ORIGINAL_ACTIVITIES))
-
-
-@pytest.fixture
-def client():
-    return TestClient(app, follow_redirects=False)
+# Chess Club starts with 2 of 12 participants; these fill the remaining slots.
+_CAPACITY_FILLERS = [f"student{i}@mergington.edu" for i in range(10)]
 
 
 # ---------------------------------------------------------------------------
@@ -45,46 +27,21 @@ def client():
 # ---------------------------------------------------------------------------
 
 class TestGetActivities:
-    def test_returns_200(self, client: TestClient):
-        # Arrange — no extra setup; default activities are already seeded
-
-        # Act
-        response = client.get("/activities")
-
-        # Assert
-        assert response.status_code == 200
-
-    def test_returns_all_activities(self, client: TestClient):
+    async def test_get_activities_contract(self, client: httpx.AsyncClient):
         # Arrange — no extra setup; 9 activities are seeded by default
+        expected_activity = "Chess Club"
+        expected_fields = {"description", "schedule", "max_participants", "participants"}
 
         # Act
-        response = client.get("/activities")
+        response = await client.get("/activities")
 
         # Assert
+        assert response.status_code == 200
         data = response.json()
         assert isinstance(data, dict)
         assert len(data) == 9
-
-    def test_known_activity_present(self, client: TestClient):
-        # Arrange
-        expected_activity = "Chess Club"
-
-        # Act
-        response = client.get("/activities")
-
-        # Assert
-        assert expected_activity in response.json()
-
-    def test_activity_has_expected_fields(self, client: TestClient):
-        # Arrange
-        expected_fields = {"description", "schedule", "max_participants", "participants"}
-
-        # Act
-        response = client.get("/activities")
-
-        # Assert
-        chess = response.json()["Chess Club"]
-        assert expected_fields.issubset(chess.keys())
+        assert expected_activity in data
+        assert expected_fields <= data[expected_activity].keys()
 
 
 # ---------------------------------------------------------------------------
@@ -92,44 +49,34 @@ class TestGetActivities:
 # ---------------------------------------------------------------------------
 
 class TestSignup:
-    def test_signup_success(self, client: TestClient):
+    async def test_signup_success(self, client: httpx.AsyncClient, activities, original_activities):
         # Arrange
         activity_name = "Chess Club"
         email = "newstudent@mergington.edu"
 
         # Act
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup",
             params={"email": email},
         )
 
         # Assert
         assert response.status_code == 200
-        assert email in activities[activity_name]["participants"]
-
-    def test_signup_returns_confirmation_message(self, client: TestClient):
-        # Arrange
-        activity_name = "Chess Club"
-        email = "newstudent@mergington.edu"
-
-        # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": email},
-        )
-
-        # Assert
+        assert activities[activity_name]["participants"] == [
+            *original_activities[activity_name]["participants"],
+            email,
+        ]
         body = response.json()
         assert "message" in body
         assert email in body["message"]
 
-    def test_signup_activity_not_found(self, client: TestClient):
+    async def test_signup_activity_not_found(self, client: httpx.AsyncClient):
         # Arrange
         activity_name = "Nonexistent Club"
         email = "student@mergington.edu"
 
         # Act
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup",
             params={"email": email},
         )
@@ -137,52 +84,49 @@ class TestSignup:
         # Assert
         assert response.status_code == 404
 
-    def test_signup_already_registered(self, client: TestClient):
-        # Arrange — "michael@mergington.edu" is pre-seeded in Chess Club
-        activity_name = "Chess Club"
-        email = "michael@mergington.edu"
-
-        # Act
-        response = client.post(
+    @pytest.mark.parametrize(
+        "activity_name, email",
+        [
+            ("Chess Club", "michael@mergington.edu"),
+            ("Programming Class", "emma@mergington.edu"),
+        ],
+        ids=["chess-club", "programming-class"],
+    )
+    async def test_signup_already_registered(
+        self, client: httpx.AsyncClient, activities, activity_name, email
+    ):
+        # Arrange — email is pre-seeded in the given activity
+
+        # Act
+        response = await client.post(
             f"/activities/{activity_name}/signup",
             params={"email": email},
         )
 
         # Assert
         assert response.status_code == 400
-
-    def test_signup_duplicate_returns_error_detail(self, client: TestClient):
-        # Arrange — "michael@mergington.edu" is pre-seeded in Chess Club
-        activity_name = "Chess Club"
-        email = "michael@mergington.edu"
-
-        # Act
-        response = client.post(
-            f"/activities/{activity_name}/signup",
-            params={"email": email},
-        )
-
-        # Assert
         assert "detail" in response.json()
+        assert activities[activity_name]["participants"].count(email) == 1
 
-    def test_signup_capacity_exceeded_returns_400(self, client: TestClient):
+    async def test_signup_capacity_exceeded_returns_400(self, client: httpx.AsyncClient, activities):
         # Arrange — Chess Club has max_participants=12 and starts with 2 members;
         #            fill the remaining 10 slots so it is at capacity.
         activity_name = "Chess Club"
-        for i in range(10):
-            client.post(
-                f"/activities/{activity_name}/signup",
-                params={"email": f"student{i}@mergington.edu"},
-            )
+        activities[activity_name]["participants"].extend(_CAPACITY_FILLERS)
+        assert (
+            len(activities[activity_name]["participants"])
+            == activities[activity_name]["max_participants"]
+        )
 
         # Act — attempt to sign up one more student beyond capacity
-        response = client.post(
+        response = await client.post(
             f"/activities/{activity_name}/signup",
             params={"email": "overflow@mergington.edu"},
         )
 
         # Assert
         assert response.status_code == 400
+        assert "overflow@mergington.edu" not in activities[activity_name]["participants"]
 
 
 # ---------------------------------------------------------------------------
@@ -190,13 +134,13 @@ class TestSignup:
 # ---------------------------------------------------------------------------
 
 class TestUnregister:
-    def test_unregister_success(self, client: TestClient):
+    async def test_unregister_success(self, client: httpx.AsyncClient, activities):
         # Arrange — "michael@mergington.edu" is pre-seeded in Chess Club
         activity_name = "Chess Club"
         email = "michael@mergington.edu"
 
         # Act
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister",
             params={"email": email},
         )
@@ -204,30 +148,17 @@ class TestUnregister:
         # Assert
         assert response.status_code == 200
         assert email not in activities[activity_name]["participants"]
-
-    def test_unregister_returns_confirmation_message(self, client: TestClient):
-        # Arrange — "michael@mergington.edu" is pre-seeded in Chess Club
-        activity_name = "Chess Club"
-        email = "michael@mergington.edu"
-
-        # Act
-        response = client.delete(
-            f"/activities/{activity_name}/unregister",
-            params={"email": email},
-        )
-
-        # Assert
         body = response.json()
         assert "message" in body
         assert email in body["message"]
 
-    def test_unregister_activity_not_found(self, client: TestClient):
+    async def test_unregister_activity_not_found(self, client: httpx.AsyncClient):
         # Arrange
         activity_name = "Nonexistent Club"
         email = "student@mergington.edu"
 
         # Act
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister",
             params={"email": email},
         )
@@ -235,32 +166,27 @@ class TestUnregister:
         # Assert
         assert response.status_code == 404
 
-    def test_unregister_not_registered(self, client: TestClient):
-        # Arrange — "nobody@mergington.edu" is not in any activity
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "nobody@mergington.edu",
+            "emma@mergington.edu",
+        ],
+        ids=["unknown-student", "registered-elsewhere"],
+    )
+    async def test_unregister_not_registered(self, client: httpx.AsyncClient, email):
+        # Arrange — email is not a Chess Club participant
+        #           ("emma@mergington.edu" is only in Programming Class)
         activity_name = "Chess Club"
-        email = "nobody@mergington.edu"
 
         # Act
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister",
             params={"email": email},
         )
 
         # Assert
         assert response.status_code == 400
-
-    def test_unregister_not_registered_returns_error_detail(self, client: TestClient):
-        # Arrange — "nobody@mergington.edu" is not in any activity
-        activity_name = "Chess Club"
-        email = "nobody@mergington.edu"
-
-        # Act
-        response = client.delete(
-            f"/activities/{activity_name}/unregister",
-            params={"email": email},
-        )
-
-        # Assert
         assert "detail" in response.json()
 
 
@@ -269,21 +195,53 @@ class TestUnregister:
 # ---------------------------------------------------------------------------
 
 class TestRoot:
-    def test_root_redirects(self, client: TestClient):
+    async def test_root_redirects(self, client: httpx.AsyncClient):
         # Arrange — no extra setup needed
 
         # Act
-        response = client.get("/")
+        response = await client.get("/")
 
         # Assert
         assert response.status_code in (301, 302, 307, 308)
 
-    def test_root_redirect_location(self, client: TestClient):
+    async def test_root_redirect_location(self, client: httpx.AsyncClient):
         # Arrange
         expected_location = "/static/index.html"
 
         # Act
-        response = client.get("/")
+        response = await client.get("/")
 
         # Assert
         assert response.headers["location"] == expected_location
+
+
+# ---------------------------------------------------------------------------
+# Test isolation (tests/conftest.py)
+# ---------------------------------------------------------------------------
+
+class TestRestoreActivities:
+    async def test_restores_removed_and_added_activities(
+        self, activities, original_activities, restore_activities
+    ):
+        # Arrange — remove a seed activity, add a new one, mutate a survivor
+        chess = activities["Chess Club"]
+        chess["participants"].append("extra@mergington.edu")
+        del activities["Gym Class"]
+        activities["Robotics Club"] = {
+            "description": "Build robots",
+            "schedule": "Saturdays, 10:00 AM - 12:00 PM",
+            "max_participants": 8,
+            "participants": [],
+        }
+
+        # Act
+        restore_activities()
+
+        # Assert — seed order and data are back, and survivors kept identity
+        assert list(activities) == list(original_activities)
+        assert activities["Chess Club"] is chess
+        for name, original in original_activities.items():
+            assert activities[name] == {
+                **original,
+                "participants": list(original["participants"]),
+            }